@@ -1,8 +1,10 @@
+import sys
+import time
 from datetime import datetime
 
 class BackendError(Exception):
     """Base exception for backend-related errors."""
-    pass
+    __slots__ = ()
 
 class BackendDatabaseError(BackendError):
     """Raised when a database operation fails in the backend.
@@ -12,14 +14,21 @@ class BackendDatabaseError(BackendError):
         query (str): The database query that failed.
         timestamp (datetime): Time the error occurred.
     """
+    __slots__ = ('message', 'query', '_ts_ns')  # No per-instance __dict__; fixed C-level attribute slots
+
     def __init__(self, message, query=None):
         self.message = message
         self.query = query
-        self.timestamp = datetime.now()
+        self._ts_ns = time.time_ns()  # Single clock read; no datetime object on the raise path
         super().__init__(self.message)
     
+    @property
+    def timestamp(self):
+        """datetime: Time the error occurred (materialized lazily)."""
+        return datetime.fromtimestamp(self._ts_ns / 1e9)
+    
     def __str__(self):
-        return f"[{self.timestamp}] {self.message} (Query: {self.query if self.query else 'None'})"
+        return "[%s] %s (Query: %s)" % (self.timestamp, self.message, self.query or 'None')
 
 class BackendAPIError(BackendError):
     """Raised when an API call fails in the backend.
@@ -28,13 +37,16 @@ class BackendAPIError(BackendError):
         message (str): Explanation of the error.
         status_code (int): HTTP status code of the failed API call.
     """
+    __slots__ = ('message', 'status_code')  # No per-instance __dict__; fixed C-level attribute slots
+
     def __init__(self, message, status_code=None):
         self.message = message
         self.status_code = status_code
         super().__init__(self.message)
     
     def __str__(self):
-        return f"{self.message} (Status Code: {self.status_code if self.status_code else 'None'})"
+        # `is not None` rather than truthiness: 0 is a legitimate status code
+        return "%s (Status Code: %s)" % (self.message, self.status_code if self.status_code is not None else 'None')
 
 class BackendAuthenticationError(BackendError):
     """Raised when authentication fails in the backend.
@@ -43,13 +55,15 @@ class BackendAuthenticationError(BackendError):
         message (str): Explanation of the error.
         user_id: The user ID associated with the failure.
     """
+    __slots__ = ('message', 'user_id')  # No per-instance __dict__; fixed C-level attribute slots
+
     def __init__(self, message, user_id=None):
         self.message = message
         self.user_id = user_id
         super().__init__(self.message)
     
     def __str__(self):
-        return f"{self.message} (User ID: {self.user_id if self.user_id else 'None'})"
+        return "%s (User ID: %s)" % (self.message, self.user_id or 'None')
 
 class BackendConfigurationError(BackendError):
     """Raised when configuration settings are invalid in the backend.
@@ -58,10 +72,14 @@ class BackendConfigurationError(BackendError):
         message (str): Explanation of the error.
         config_key (str): The invalid configuration key.
     """
+    __slots__ = ('message', 'config_key')  # No per-instance __dict__; fixed C-level attribute slots
+
     def __init__(self, message, config_key=None):
         self.message = message
-        self.config_key = config_key
+        # Config keys come from a small fixed set, so interning collapses
+        # repeated raises onto one shared string object.
+        self.config_key = sys.intern(config_key) if isinstance(config_key, str) else config_key
         super().__init__(self.message)
     
     def __str__(self):
-        return f"{self.message} (Config Key: {self.config_key if self.config_key else 'None'})"
+        return "%s (Config Key: %s)" % (self.message, self.config_key or 'None')
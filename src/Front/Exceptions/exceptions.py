@@ -1,8 +1,10 @@
+import sys
+import time
 from datetime import datetime
 
 class FrontendError(Exception):
     """Base exception for frontend-related errors."""
-    pass
+    __slots__ = ()
 
 class FrontendValidationError(FrontendError):
     """Raised when user input validation fails in the frontend.
@@ -12,14 +14,21 @@ class FrontendValidationError(FrontendError):
         input_data: The invalid input that caused the error.
         timestamp (datetime): Time the error occurred.
     """
+    __slots__ = ('message', 'input_data', '_ts_ns')  # No per-instance __dict__; fixed C-level attribute slots
+
     def __init__(self, message, input_data=None):
         self.message = message
         self.input_data = input_data
-        self.timestamp = datetime.now()
+        self._ts_ns = time.time_ns()  # Single clock read; no datetime object on the raise path
         super().__init__(self.message)
     
+    @property
+    def timestamp(self):
+        """datetime: Time the error occurred (materialized lazily)."""
+        return datetime.fromtimestamp(self._ts_ns / 1e9)
+    
     def __str__(self):
-        return f"[{self.timestamp}] {self.message} (Input: {self.input_data if self.input_data else 'None'})"
+        return "[%s] %s (Input: %s)" % (self.timestamp, self.message, self.input_data or 'None')
 
 class FrontendRenderingError(FrontendError):
     """Raised when rendering fails in the frontend.
@@ -28,13 +37,17 @@ class FrontendRenderingError(FrontendError):
         message (str): Explanation of the error.
         component (str): The component that failed to render.
     """
+    __slots__ = ('message', 'component')  # No per-instance __dict__; fixed C-level attribute slots
+
     def __init__(self, message, component=None):
         self.message = message
-        self.component = component
+        # Component names come from a small fixed set, so interning collapses
+        # repeated raises onto one shared string object.
+        self.component = sys.intern(component) if isinstance(component, str) else component
         super().__init__(self.message)
     
     def __str__(self):
-        return f"{self.message} (Component: {self.component if self.component else 'None'})"
+        return "%s (Component: %s)" % (self.message, self.component or 'None')
 
 class FrontendConnectionError(FrontendError):
     """Raised when a connection to an external service fails in the frontend.
@@ -43,13 +56,17 @@ class FrontendConnectionError(FrontendError):
         message (str): Explanation of the error.
         service (str): The external service that failed.
     """
+    __slots__ = ('message', 'service')  # No per-instance __dict__; fixed C-level attribute slots
+
     def __init__(self, message, service=None):
         self.message = message
-        self.service = service
+        # Service names come from a small fixed set, so interning collapses
+        # repeated raises onto one shared string object.
+        self.service = sys.intern(service) if isinstance(service, str) else service
         super().__init__(self.message)
     
     def __str__(self):
-        return f"{self.message} (Service: {self.service if self.service else 'None'})"
+        return "%s (Service: %s)" % (self.message, self.service or 'None')
 
 class FrontendConfigurationError(FrontendError):
     """Raised when configuration settings are invalid in the frontend.
@@ -58,10 +75,14 @@ class FrontendConfigurationError(FrontendError):
         message (str): Explanation of the error.
         config_key (str): The invalid configuration key.
     """
+    __slots__ = ('message', 'config_key')  # No per-instance __dict__; fixed C-level attribute slots
+
     def __init__(self, message, config_key=None):
         self.message = message
-        self.config_key = config_key
+        # Config keys come from a small fixed set, so interning collapses
+        # repeated raises onto one shared string object.
+        self.config_key = sys.intern(config_key) if isinstance(config_key, str) else config_key
         super().__init__(self.message)
     
     def __str__(self):
-        return f"{self.message} (Config Key: {self.config_key if self.config_key else 'None'})"
+        return "%s (Config Key: %s)" % (self.message, self.config_key or 'None')
@@ -1,4 +1,14 @@
 import logging
+import logging.handlers
+
+class _BufFileHandler(logging.FileHandler):
+    """FileHandler variant that opens the log file lazily with a 128 KiB buffer.
+
+    delay=True defers the open until the first emit, and the explicit UTF-8
+    encoding skips locale detection when it finally happens.
+    """
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=131072, encoding='utf-8')
 
 def setup_logger(name, log_file='frontend.log', level=logging.INFO):
     """Configure and return a logger for frontend components.
@@ -14,10 +24,20 @@ def setup_logger(name, log_file='frontend.log', level=logging.INFO):
     logger = logging.getLogger(name)
     if not logger.handlers:  # Avoid duplicate handlers
         logger.setLevel(level)
-        handler = logging.FileHandler(log_file)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        file_handler = _BufFileHandler(log_file, delay=True)  # No open (or syscalls) until the first record
+        # defaults= fills exc_type for records that were not emitted through
+        # log_exception, so plain logger.info/error calls keep working.
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(exc_type)s - %(message)s',
+            defaults={'exc_type': '-'},
+        )
+        file_handler.setFormatter(formatter)
+        # Buffer records and flush in batches (immediately on ERROR or above), so the
+        # hot path does not pay one write syscall per record.
+        buffered = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        logger.addHandler(buffered)
     return logger
 
 def log_exception(logger, exception, message):
@@ -28,4 +48,14 @@ def log_exception(logger, exception, message):
         exception (Exception): The exception to log.
         message (str): Additional message to include in the log.
     """
-    logger.error(f"{message}: {str(exception)}", exc_info=True)
+    if not logger.isEnabledFor(logging.ERROR):
+        return  # Skip all formatting and exc_info capture when ERROR is suppressed
+    logger.error(
+        "%s: %s", message, exception, exc_info=True,
+        # Machine-readable fields on the record itself, so filters and
+        # structured handlers can key on them without parsing the message.
+        extra={
+            "exc_type": type(exception).__name__,
+            "exc_message": getattr(exception, "message", str(exception)),
+        },
+    )